@@ -8,10 +8,9 @@ async def main():
         "CLIENT_ID",
         "CLIENT_SECRET",
     )
-    api = spotify.API(auth)
-
-    artist = await api.get_artist("0e86yPdC41PGRkLp2Q1Bph")
-    print(artist.name)
+    async with spotify.API(auth) as api:
+        artist = await api.get_artist("0e86yPdC41PGRkLp2Q1Bph")
+        print(artist.name)
 
 
 asyncio.run(main())
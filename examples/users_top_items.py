@@ -50,10 +50,8 @@ async def account():
         client_id="CLIENT_ID",
         client_secret="CLIENT_SECRET",
     )
-    api = spotify.API(auth)
-    top = await api.get_users_top_items(type=spotify.TopItemType.TRACKS)
-
-    await api.session.close()
+    async with spotify.API(auth) as api:
+        top = await api.get_users_top_items(type=spotify.TopItemType.TRACKS)
 
     return (
         "<ol>"
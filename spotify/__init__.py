@@ -1,6 +1,7 @@
 """An asynchronous Python 3.10+ Spotify Web API wrapper."""
 
 from spotify.api import *
+from spotify.batch import *
 from spotify.enums import *
 from spotify.errors import *
 from spotify.models import *
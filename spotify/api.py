@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import base64
+import collections
+import contextlib
+import copy
 import datetime
+import itertools
 import json as json_
+import math
+import operator
+import random
+import time
 import typing
+from collections.abc import AsyncGenerator
 
 import aiohttp
 import pydantic
+import yarl
 
 import spotify
 from spotify import enums, errors, internals, models, utils
@@ -20,6 +31,38 @@ __all__: typing.Sequence[str] = ("API",)
 P = typing.ParamSpec("P")
 T = typing.TypeVar("T")
 
+_IMAGE_LIST_ADAPTER = pydantic.TypeAdapter(list[models.Image])
+_MILLISECOND = datetime.timedelta(milliseconds=1)
+_comma_join = ",".join
+_enum_value = operator.attrgetter("value")
+_encode_json_str = json_.encoder.encode_basestring_ascii
+
+# parametrized once, rather than on every call
+_PlaylistItemPaginator = models.Paginator[models.PlaylistItem]
+_SimplePlaylistPaginator = models.Paginator[models.SimplePlaylist]
+_SavedTrackPaginator = models.Paginator[models.SavedTrack]
+_SavedShowPaginator = models.Paginator[models.SavedShow]
+_SimpleEpisodePaginator = models.Paginator[models.SimpleEpisode]
+_PlayHistoryCursorPaginator = models.CursorPaginator[models.PlayHistory]
+_SimpleTrackPaginator = models.Paginator[models.SimpleTrack]
+_SavedAlbumPaginator = models.Paginator[models.SavedAlbum]
+_ArtistAlbumPaginator = models.Paginator[models.ArtistAlbum]
+_SimpleChapterPaginator = models.Paginator[models.SimpleChapter]
+_SimpleAudiobookPaginator = models.Paginator[models.SimpleAudiobook]
+_SavedEpisodePaginator = models.Paginator[models.SavedEpisode]
+_ArtistPaginator = models.Paginator[models.Artist]
+_TrackWithSimpleArtistPaginator = models.Paginator[models.TrackWithSimpleArtist]
+
+
+def _retry_after(value: str | None) -> float:
+    # Retry-After may also be given as an HTTP date, or be missing or malformed, in which case 0 is
+    # returned and the exponential backoff is used instead
+    try:
+        seconds = float(value) if value else 0.0
+    except ValueError:
+        return 0.0
+    return seconds if math.isfinite(seconds) and seconds > 0 else 0.0
+
 
 def validator(
     func: typing.Callable[P, typing.Awaitable[T]],
@@ -34,6 +77,56 @@ def validator(
     return inner
 
 
+def _freeze(value: typing.Any) -> typing.Hashable:
+    return tuple(value) if isinstance(value, list) else value
+
+
+def ttl_cache(
+    ttl: float,
+    *,
+    maxsize: int = 128,
+    enabled: typing.Callable[[API], bool] | None = None,
+) -> typing.Callable[
+    [typing.Callable[typing.Concatenate[API, P], typing.Awaitable[T]]],
+    typing.Callable[typing.Concatenate[API, P], typing.Awaitable[T]],
+]:
+    """Cache an endpoint's result on the API instance for `ttl` seconds, keyed on its arguments.
+
+    Up to `maxsize` results are kept per endpoint, evicting the least recently used. A deep
+    copy of the cached result is returned, so callers may modify it freely. If `enabled` is
+    given, the cache is bypassed for API instances it returns `False` for.
+    """
+
+    def decorator(
+        func: typing.Callable[typing.Concatenate[API, P], typing.Awaitable[T]],
+    ) -> typing.Callable[typing.Concatenate[API, P], typing.Awaitable[T]]:
+        async def inner(self: API, *args: P.args, **kwargs: P.kwargs) -> T:
+            if enabled is not None and not enabled(self):
+                return await func(self, *args, **kwargs)
+
+            cache = self._cache.setdefault(func.__name__, {})
+            # keyword order doesn't matter, and lists are made hashable
+            key = (
+                tuple(_freeze(a) for a in args),
+                tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())),
+            )
+
+            cached = cache.pop(key, None)
+            if cached is not None and cached[0] > time.monotonic():
+                cache[key] = cached
+                return copy.deepcopy(cached[1])
+
+            result = await func(self, *args, **kwargs)
+            cache[key] = (time.monotonic() + ttl, result)
+            if len(cache) > maxsize:
+                del cache[next(iter(cache))]
+            return copy.deepcopy(result)
+
+        return inner
+
+    return decorator
+
+
 class API:
     """Implementation to make API calls with.
 
@@ -41,102 +134,211 @@ class API:
     ----------
     access_flow : oauth.AuthorizationCodeFlow | oauth.ClientCredentialsFlow
         Access flow to use for api requests.
+    validate : bool, default: True
+        Whether or not to validate the payloads received from Spotify.
+
+        !!! warning
+            Disabling validation makes decoding responses considerably faster, but no conversions
+            are applied to the data received. For example, timestamps are left as strings,
+            durations are left in milliseconds and enum fields are left as plain strings. Only
+            disable it if you trust the payloads and handle the raw values yourself.
+    max_concurrency : int, optional
+        The maximum number of requests that may be in flight at once. Default: unlimited.
+    max_retries : int, default: 3
+        How many times a request is retried when rate limited (HTTP 429) by Spotify, before
+        [`APIError`][spotify.errors.APIError] is raised. Retries wait for the `Retry-After`
+        period given by Spotify, backing off exponentially.
+    rate_limit : float, optional
+        The maximum number of requests to make per second, on average, which must be greater
+        than 0. Short bursts of up to this many requests (at least one) are allowed. When rate
+        limited by Spotify, all requests are held back for the `Retry-After` period.
+        Default: unlimited.
+    connector : aiohttp.BaseConnector, optional
+        The connector to make requests with. It is not closed along with the
+        [`session`][spotify.api.API.session], and must be closed by the caller.
+        Default: a connection pool which keeps idle connections alive between requests.
+    cache_recommendations : bool, default: False
+        Whether to cache the result of
+        [`get_recommendations`][spotify.api.API.get_recommendations] for 5 minutes for each set
+        of arguments. Recommendations are randomized, so a cached result is repeated rather than
+        a fresh set being fetched.
     """
 
+    __slots__: typing.Sequence[str] = (
+        "access_flow",
+        "_session",
+        "_base_url",
+        "_validate",
+        "_semaphore",
+        "_max_retries",
+        "_rate_limiter",
+        "_cache",
+        "_cache_recommendations",
+        "_connector",
+    )
+
     def __init__(
         self,
         access_flow: oauth.AuthorizationCodeFlow | oauth.ClientCredentialsFlow,
+        *,
+        validate: bool = True,
+        max_concurrency: int | None = None,
+        max_retries: int = 3,
+        rate_limit: float | None = None,
+        connector: aiohttp.BaseConnector | None = None,
+        cache_recommendations: bool = False,
     ) -> None:
         self.access_flow = access_flow
 
         self._session: aiohttp.ClientSession | None = None
+        self._base_url = yarl.URL(spotify.BASE_URL)
+        self._validate = validate
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._max_retries = max_retries
+        self._rate_limiter = utils.RateLimiter(rate_limit) if rate_limit is not None else None
+        self._cache: dict[str, dict[typing.Hashable, tuple[float, typing.Any]]] = {}
+        self._cache_recommendations = cache_recommendations
+        self._connector = connector
 
     @property
     def session(self) -> aiohttp.ClientSession:
         """The [aiohttp `ClientSession`][aiohttp.ClientSession] to use for requests.
 
-        Must be closed after all requests have been completed.
+        Must be closed with [`close`][spotify.api.API.close] after all requests have been
+        completed. Connections are pooled and kept alive between requests. Its connector is
+        shared with the access flow, so that token refreshes reuse the same connection pool.
         """
         if not self._session:
-            self._session = aiohttp.ClientSession()
+            if self._connector is not None:
+                self._session = aiohttp.ClientSession(
+                    connector=self._connector, connector_owner=False
+                )
+            else:
+                # keep idle connections around for longer than aiohttp's default 15 seconds, so
+                # that sporadic calls (e.g. player controls) don't pay for a new TLS handshake
+                connector = aiohttp.TCPConnector(
+                    limit=100, limit_per_host=64, keepalive_timeout=75, ttl_dns_cache=300
+                )
+                self._session = aiohttp.ClientSession(connector=connector)
+            self.access_flow.connector = self._session.connector
 
         return self._session
 
-    async def request(
-        self,
-        method: str,
-        url: str,
-        *,
-        params: dict[str, typing.Any] | None = None,
-        json: dict[str, typing.Any] | None = None,
-        data: bytes | None = None,
-    ) -> bytes | None:
-        await self.access_flow.validate_token()
-
-        async with self.session.request(
-            method,
-            f"{spotify.BASE_URL}/{url}" if not url.startswith(spotify.BASE_URL) else url,
-            params=utils.process_dict(params) if params is not None else None,
-            json=utils.process_dict(json) if json is not None else None,
-            data=data if data is not None else None,
-            headers={
-                "Authorization": f"Bearer {self.access_flow.access_token}",
-                "Content-Type": "application/json",
-            },
-        ) as r:
-            data = await r.content.read()
-
-            if r.content_type == "application/json" and r.ok:
-                return data
-            elif r.content_type == "application/json":
-                json_data = json_.loads(data)
-                if json_data.get("error"):
-                    raise errors.APIError(**json_data["error"])
-
-            raise errors.APIError(
-                status=r.status,
-                message=r.reason,
-            )
+    async def close(self) -> None:
+        """Close the [`session`][spotify.api.API.session] and its connection pool.
 
-    async def get(
-        self,
-        url: str,
-        *,
-        params: dict[str, typing.Any] | None = None,
-        json: dict[str, typing.Any] | None = None,
-        data: bytes | None = None,
-    ) -> bytes | None:
-        return await self.request("GET", url, params=params, json=json, data=data)
+        A new session is created if any further requests are made.
+        """
+        if self._session:
+            await self._session.close()
+            self._session = None
+            self.access_flow.connector = None
 
-    async def post(
-        self,
-        url: str,
-        *,
-        params: dict[str, typing.Any] | None = None,
-        json: dict[str, typing.Any] | None = None,
-        data: bytes | None = None,
-    ) -> bytes | None:
-        return await self.request("POST", url, params=params, json=json, data=data)
+    async def __aenter__(self) -> typing.Self:
+        return self
 
-    async def put(
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+    async def _parse(self, model: type[utils.ModelT], data: bytes) -> utils.ModelT:
+        if self._validate:
+            return await utils.validate_json(model, data)
+
+        return utils.construct_model(model, json_.loads(data))
+
+    async def _chunked(
         self,
-        url: str,
+        func: typing.Callable[[list[str]], typing.Awaitable[T]],
+        ids: list[str],
         *,
-        params: dict[str, typing.Any] | None = None,
-        json: dict[str, typing.Any] | None = None,
-        data: bytes | None = None,
-    ) -> bytes | None:
-        return await self.request("PUT", url, params=params, json=json, data=data)
+        size: int = 50,
+        concurrency: int = 10,
+    ) -> list[T]:
+        # Split `ids` into batches of at most `size`, making up to `concurrency` requests at once.
+        # Nothing is requested for an empty list. With a `concurrency` of 1 the batches are sent
+        # in order, stopping at the first that fails, which suits requests that modify data.
+        if not ids:
+            return []
+        if len(ids) <= size:
+            return [await func(ids)]
+
+        chunks = [ids[i : i + size] for i in range(0, len(ids), size)]
+        if concurrency == 1:
+            return [await func(chunk) for chunk in chunks]
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(chunk: list[str]) -> T:
+            async with semaphore:
+                return await func(chunk)
+
+        tasks = [asyncio.ensure_future(run(chunk)) for chunk in chunks]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # don't leave the remaining batches running, or their errors unretrieved
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
-    async def delete(
+    async def request(
         self,
+        method: str,
         url: str,
         *,
         params: dict[str, typing.Any] | None = None,
         json: dict[str, typing.Any] | None = None,
         data: bytes | None = None,
-    ) -> bytes | None:
-        return await self.request("DELETE", url, params=params, json=json, data=data)
+    ) -> bytes:
+        url_ = (
+            self._base_url / url
+            if not url.startswith(spotify.BASE_URL)
+            else yarl.URL(url, encoded=True)
+        )
+        params = (utils.process_dict(params) or None) if params else None
+        json = utils.process_dict(json) if json is not None else None
+
+        attempt = 0
+        while True:
+            await self.access_flow.validate_token()
+            if self._rate_limiter:
+                await self._rate_limiter.acquire()
+
+            async with self._semaphore or contextlib.nullcontext():
+                async with self.session.request(
+                    method,
+                    url_,
+                    params=params,
+                    json=json,
+                    data=data,
+                    headers={
+                        "Authorization": f"Bearer {self.access_flow.access_token}",
+                        "Content-Type": "application/json",
+                    },
+                ) as r:
+                    response = await r.content.read()
+
+                    if r.status == 429 and attempt < self._max_retries:
+                        retry_after = _retry_after(r.headers.get("Retry-After"))
+                        if self._rate_limiter:
+                            self._rate_limiter.pause(retry_after)
+                    elif r.ok and (r.content_type == "application/json" or not response):
+                        return response
+                    else:
+                        if r.content_type == "application/json":
+                            json_data = json_.loads(response)
+                            if json_data.get("error"):
+                                raise errors.APIError(**json_data["error"])
+
+                        raise errors.APIError(
+                            status=r.status,
+                            message=r.reason,
+                        )
+
+            # sleep outside of the semaphore, so a rate limited request doesn't hold up others
+            await asyncio.sleep(max(retry_after, 0.25 * 2**attempt) + random.uniform(0, 0.1))
+            attempt += 1
 
     @validator
     async def get_album(self, album_id: str, *, market: MissingOr[str] = MISSING) -> models.Album:
@@ -155,9 +357,8 @@ class API:
         models.Album
             The requested album.
         """
-        album = await self.get(f"albums/{album_id}", params={"market": market})
-        assert album is not None
-        return models.Album.model_validate_json(album)
+        album = await self.request("GET", f"albums/{album_id}", params={"market": market})
+        return await self._parse(models.Album, album)
 
     @validator
     async def get_several_albums(
@@ -178,9 +379,13 @@ class API:
         list[models.Album]
             The requested albums.
         """
-        albums = await self.get("albums", params={"ids": ",".join(album_ids), "market": market})
-        assert albums is not None
-        return internals.Albums.model_validate_json(albums).albums
+        if not album_ids:
+            return []
+
+        albums = await self.request(
+            "GET", "albums", params={"ids": _comma_join(album_ids), "market": market}
+        )
+        return (await self._parse(internals.Albums, albums)).albums
 
     @validator
     async def get_album_tracks(
@@ -210,12 +415,12 @@ class API:
         models.Paginator[models.Track]
             A paginator who's items are a list of tracks.
         """
-        tracks = await self.get(
+        tracks = await self.request(
+            "GET",
             f"albums/{album_id}/tracks",
             params={"limit": limit, "offset": offset, "market": market},
         )
-        assert tracks is not None
-        return models.Paginator[models.SimpleTrack].from_payload(tracks, self, models.SimpleTrack)
+        return await _SimpleTrackPaginator.from_payload(tracks, self, models.SimpleTrack)
 
     @validator
     async def get_users_saved_albums(
@@ -245,12 +450,12 @@ class API:
         models.Paginator[models.SavedAlbum]
             A paginator who's items are a list of albums.
         """
-        albums = await self.get(
+        albums = await self.request(
+            "GET",
             "me/albums",
             params={"limit": limit, "offset": offset, "market": market},
         )
-        assert albums is not None
-        return models.Paginator[models.SavedAlbum].from_payload(albums, self, models.SavedAlbum)
+        return await _SavedAlbumPaginator.from_payload(albums, self, models.SavedAlbum)
 
     @validator
     async def save_albums_for_current_user(
@@ -267,7 +472,10 @@ class API:
         album_ids : list[str]
             The IDs of the albums. Maximum: 50.
         """
-        await self.put("me/albums", json={"ids": album_ids})
+        if not album_ids:
+            return
+
+        await self.request("PUT", "me/albums", json={"ids": album_ids})
 
     @validator
     async def remove_users_saved_albums(self, album_ids: list[str]) -> None:
@@ -281,7 +489,10 @@ class API:
         album_ids : list[str]
             The IDs of the albums. Maximum: 50.
         """
-        await self.delete("me/albums", json={"ids": album_ids})
+        if not album_ids:
+            return
+
+        await self.request("DELETE", "me/albums", json={"ids": album_ids})
 
     @validator
     async def check_users_saved_albums(self, album_ids: list[str]) -> list[bool]:
@@ -300,9 +511,13 @@ class API:
         list[bool]
             A list of booleans dictating whether or not the corresponding albums are saved.
         """
-        albums = await self.get("me/albums/contains", params={"ids": ",".join(album_ids)})
-        assert albums is not None
-        return json_.loads(albums)
+        if not album_ids:
+            return []
+
+        albums = await self.request(
+            "GET", "me/albums/contains", params={"ids": _comma_join(album_ids)}
+        )
+        return utils.parse_bool_list(albums)
 
     @validator
     async def get_new_releases(
@@ -326,12 +541,12 @@ class API:
         models.Paginator[models.SimpleAlbum]
             A paginator who's items are a list of albums.
         """
-        albums = await self.get(
+        albums = await self.request(
+            "GET",
             "browse/new-releases",
             params={"limit": limit, "offset": offset},
         )
-        assert albums is not None
-        return internals.SimpleAlbumPaginator.model_validate_json(albums).paginator
+        return (await self._parse(internals.SimpleAlbumPaginator, albums)).paginator
 
     @validator
     async def get_artist(self, artist_id: str) -> models.Artist:
@@ -347,9 +562,8 @@ class API:
         models.Artist
             The requested artist.
         """
-        artist = await self.get(f"artists/{artist_id}")
-        assert artist is not None
-        return models.Artist.model_validate_json(artist)
+        artist = await self.request("GET", f"artists/{artist_id}")
+        return await self._parse(models.Artist, artist)
 
     @validator
     async def get_several_artists(self, artist_ids: list[str]) -> list[models.Artist]:
@@ -365,9 +579,11 @@ class API:
         list[models.Artist]
             The requested artists.
         """
-        artists = await self.get("artists", params={"ids": ",".join(artist_ids)})
-        assert artists is not None
-        return internals.Artists.model_validate_json(artists).artists
+        if not artist_ids:
+            return []
+
+        artists = await self.request("GET", "artists", params={"ids": _comma_join(artist_ids)})
+        return (await self._parse(internals.Artists, artists)).artists
 
     @validator
     async def get_artists_albums(
@@ -400,10 +616,11 @@ class API:
         models.Paginator[models.ArtistAlbum]
             A paginator who's items are a list of albums.
         """
-        albums = await self.get(
+        albums = await self.request(
+            "GET",
             f"artists/{artist_id}/albums",
             params={
-                "include_groups": ",".join(g.value for g in include_groups)
+                "include_groups": _comma_join(map(_enum_value, include_groups))
                 if include_groups is not MISSING
                 else MISSING,
                 "limit": limit,
@@ -411,8 +628,7 @@ class API:
                 "market": market,
             },
         )
-        assert albums is not None
-        return models.Paginator[models.ArtistAlbum].from_payload(albums, self, models.ArtistAlbum)
+        return await _ArtistAlbumPaginator.from_payload(albums, self, models.ArtistAlbum)
 
     @validator
     async def get_artists_top_tracks(
@@ -433,9 +649,10 @@ class API:
         list[models.TrackWithSimpleArtist]
             The requested tracks.
         """
-        tracks = await self.get(f"artists/{artist_id}/top-tracks", params={"market": market})
-        assert tracks is not None
-        return internals.Tracks.model_validate_json(tracks).tracks
+        tracks = await self.request(
+            "GET", f"artists/{artist_id}/top-tracks", params={"market": market}
+        )
+        return (await self._parse(internals.Tracks, tracks)).tracks
 
     @validator
     async def get_artists_related_artists(self, artist_id: str) -> list[models.Artist]:
@@ -452,9 +669,8 @@ class API:
         list[models.Artist]
             The requested artists.
         """
-        artists = await self.get(f"artists/{artist_id}/related-artists")
-        assert artists is not None
-        return internals.Artists.model_validate_json(artists).artists
+        artists = await self.request("GET", f"artists/{artist_id}/related-artists")
+        return (await self._parse(internals.Artists, artists)).artists
 
     @validator
     async def get_audiobook(
@@ -475,9 +691,10 @@ class API:
         models.Audiobook
             The requested audiobook.
         """
-        audiobook = await self.get(f"audiobooks/{audiobook_id}", params={"market": market})
-        assert audiobook is not None
-        return models.Audiobook.model_validate_json(audiobook)
+        audiobook = await self.request(
+            "GET", f"audiobooks/{audiobook_id}", params={"market": market}
+        )
+        return await self._parse(models.Audiobook, audiobook)
 
     @validator
     async def get_several_audiobooks(
@@ -501,12 +718,15 @@ class API:
         list[models.Audiobook]
             The requested audiobooks.
         """
-        audiobooks = await self.get(
+        if not audiobook_ids:
+            return []
+
+        audiobooks = await self.request(
+            "GET",
             "audiobooks",
-            params={"ids": ",".join(audiobook_ids), "market": market},
+            params={"ids": _comma_join(audiobook_ids), "market": market},
         )
-        assert audiobooks is not None
-        return internals.Audiobooks.model_validate_json(audiobooks).audiobooks
+        return (await self._parse(internals.Audiobooks, audiobooks)).audiobooks
 
     @validator
     async def get_audiobook_chapters(
@@ -536,14 +756,12 @@ class API:
         models.Paginator[models.SimpleChapter]
             A paginator who's items are a list of chapters.
         """
-        chapters = await self.get(
+        chapters = await self.request(
+            "GET",
             f"audiobooks/{audiobook_id}/chapters",
             params={"limit": limit, "offset": offset, "market": market},
         )
-        assert chapters is not None
-        return models.Paginator[models.SimpleChapter].from_payload(
-            chapters, self, models.SimpleChapter
-        )
+        return await _SimpleChapterPaginator.from_payload(chapters, self, models.SimpleChapter)
 
     @validator
     async def get_users_saved_audiobooks(
@@ -569,9 +787,10 @@ class API:
         models.Paginator[models.SimpleAudiobook]
             A paginator who's items are a list of audiobooks.
         """
-        audiobooks = await self.get("me/audiobooks", params={"limit": limit, "offset": offset})
-        assert audiobooks is not None
-        return models.Paginator[models.SimpleAudiobook].from_payload(
+        audiobooks = await self.request(
+            "GET", "me/audiobooks", params={"limit": limit, "offset": offset}
+        )
+        return await _SimpleAudiobookPaginator.from_payload(
             audiobooks, self, models.SimpleAudiobook
         )
 
@@ -590,7 +809,10 @@ class API:
         audiobook_ids : list[str]
             The IDs of the audiobooks. Maximum: 50.
         """
-        await self.put("me/audiobooks", params={"ids": ",".join(audiobook_ids)})
+        if not audiobook_ids:
+            return
+
+        await self.request("PUT", "me/audiobooks", params={"ids": _comma_join(audiobook_ids)})
 
     @validator
     async def remove_users_saved_audiobooks(
@@ -607,7 +829,10 @@ class API:
         audiobook_ids : list[str]
             The IDs of the audiobooks. Maximum: 50.
         """
-        await self.delete("me/audiobooks", params={"ids": ",".join(audiobook_ids)})
+        if not audiobook_ids:
+            return
+
+        await self.request("DELETE", "me/audiobooks", params={"ids": _comma_join(audiobook_ids)})
 
     @validator
     async def check_users_saved_audiobooks(self, audiobook_ids: list[str]) -> list[bool]:
@@ -626,11 +851,13 @@ class API:
         list[bool]
             A list of booleans dictating whether or not the corresponding audiobooks are already saved.
         """
-        audiobooks = await self.get(
-            "me/audiobooks/contains", params={"ids": ",".join(audiobook_ids)}
+        if not audiobook_ids:
+            return []
+
+        audiobooks = await self.request(
+            "GET", "me/audiobooks/contains", params={"ids": _comma_join(audiobook_ids)}
         )
-        assert audiobooks is not None
-        return json_.loads(audiobooks)
+        return utils.parse_bool_list(audiobooks)
 
     @typing.overload
     async def get_several_browse_categories(
@@ -690,7 +917,8 @@ class API:
         else:
             locale = MISSING
 
-        categories = await self.get(
+        categories = await self.request(
+            "GET",
             "browse/categories",
             params={
                 "locale": locale,
@@ -698,8 +926,7 @@ class API:
                 "offset": offset,
             },
         )
-        assert categories is not None
-        return internals.CategoryPaginator.model_validate_json(categories).paginator
+        return (await self._parse(internals.CategoryPaginator, categories)).paginator
 
     @typing.overload
     async def get_single_browse_category(
@@ -751,14 +978,14 @@ class API:
         else:
             locale = MISSING
 
-        category = await self.get(
+        category = await self.request(
+            "GET",
             f"browse/categories/{category_id}",
             params={
                 "locale": locale,
             },
         )
-        assert category is not None
-        return models.Category.model_validate_json(category)
+        return await self._parse(models.Category, category)
 
     @validator
     async def get_chapter(
@@ -779,9 +1006,8 @@ class API:
         models.Chapter
             The requested chapter.
         """
-        chapter = await self.get(f"chapters/{chapter_id}", params={"market": market})
-        assert chapter is not None
-        return models.Chapter.model_validate_json(chapter)
+        chapter = await self.request("GET", f"chapters/{chapter_id}", params={"market": market})
+        return await self._parse(models.Chapter, chapter)
 
     @validator
     async def get_several_chapters(
@@ -805,11 +1031,13 @@ class API:
         list[models.Chapter]
             The requested chapters.
         """
-        chapters = await self.get(
-            "chapters", params={"ids": ",".join(chapter_ids), "market": market}
+        if not chapter_ids:
+            return []
+
+        chapters = await self.request(
+            "GET", "chapters", params={"ids": _comma_join(chapter_ids), "market": market}
         )
-        assert chapters is not None
-        return internals.Chapters.model_validate_json(chapters).chapters
+        return (await self._parse(internals.Chapters, chapters)).chapters
 
     @validator
     async def get_episode(
@@ -833,9 +1061,8 @@ class API:
         models.Episode
             The requested episode.
         """
-        episode = await self.get(f"episodes/{episode_id}", params={"market": market})
-        assert episode is not None
-        return models.Episode.model_validate_json(episode)
+        episode = await self.request("GET", f"episodes/{episode_id}", params={"market": market})
+        return await self._parse(models.Episode, episode)
 
     @validator
     async def get_several_episodes(
@@ -862,11 +1089,13 @@ class API:
         list[models.Episode]
             The requested episodes.
         """
-        episodes = await self.get(
-            "episodes", params={"ids": ",".join(episode_ids), "market": market}
+        if not episode_ids:
+            return []
+
+        episodes = await self.request(
+            "GET", "episodes", params={"ids": _comma_join(episode_ids), "market": market}
         )
-        assert episodes is not None
-        return internals.Episodes.model_validate_json(episodes).episodes
+        return (await self._parse(internals.Episodes, episodes)).episodes
 
     @validator
     async def get_users_saved_episodes(
@@ -899,14 +1128,12 @@ class API:
         models.Paginator[models.SavedEpisode]
             A paginator who's items are a list of episodes.
         """
-        episodes = await self.get(
+        episodes = await self.request(
+            "GET",
             "me/episodes",
             params={"limit": limit, "offset": offset, "market": market},
         )
-        assert episodes is not None
-        return models.Paginator[models.SavedEpisode].from_payload(
-            episodes, self, models.SavedEpisode
-        )
+        return await _SavedEpisodePaginator.from_payload(episodes, self, models.SavedEpisode)
 
     @validator
     async def save_episodes_for_current_user(
@@ -926,7 +1153,10 @@ class API:
         episode_ids : list[str]
             The IDs of the episodes. Maximum: 50.
         """
-        await self.put("me/episodes", params={"ids": ",".join(episode_ids)})
+        if not episode_ids:
+            return
+
+        await self.request("PUT", "me/episodes", params={"ids": _comma_join(episode_ids)})
 
     @validator
     async def remove_users_saved_episodes(self, episode_ids: list[str]) -> None:
@@ -943,7 +1173,10 @@ class API:
         episode_ids : list[str]
             The IDs of the episodes. Maximum: 50.
         """
-        await self.delete("me/episodes", params={"ids": ",".join(episode_ids)})
+        if not episode_ids:
+            return
+
+        await self.request("DELETE", "me/episodes", params={"ids": _comma_join(episode_ids)})
 
     @validator
     async def check_users_saved_episodes(self, episode_ids: list[str]) -> list[bool]:
@@ -965,36 +1198,44 @@ class API:
         list[bool]
             A list of booleans dictating whether or not the corresponding episodes are already saved.
         """
-        episodes = await self.get("me/episodes/contains", params={"ids": ",".join(episode_ids)})
-        assert episodes is not None
-        return json_.loads(episodes)
+        if not episode_ids:
+            return []
+
+        episodes = await self.request(
+            "GET", "me/episodes/contains", params={"ids": _comma_join(episode_ids)}
+        )
+        return utils.parse_bool_list(episodes)
 
     @validator
+    @ttl_cache(3600)
     async def get_available_genre_seeds(self) -> list[str]:
         """Retrieve a list of available genres seed parameter values for recommendations.
 
+        The result is cached for an hour.
+
         Returns
         -------
         list[str]
             The available genre seeds.
         """
-        genres = await self.get("recommendations/available-genre-seeds")
-        assert genres is not None
+        genres = await self.request("GET", "recommendations/available-genre-seeds")
 
-        return internals.AvailableGenreSeeds.model_validate_json(genres).genres
+        return (await self._parse(internals.AvailableGenreSeeds, genres)).genres
 
     @validator
+    @ttl_cache(3600)
     async def get_available_markets(self) -> list[str]:
         """Get the list of markets where Spotify is available.
 
+        The result is cached for an hour.
+
         Returns
         -------
         list[str]
             The markets where Spotify is available.
         """
-        markets = await self.get("markets")
-        assert markets is not None
-        return internals.AvailableMarkets.model_validate_json(markets).markets
+        markets = await self.request("GET", "markets")
+        return (await self._parse(internals.AvailableMarkets, markets)).markets
 
     @validator
     async def get_playback_state(
@@ -1018,11 +1259,12 @@ class API:
         None
             If there is no playback state.
         """
-        player = await self.get(
+        player = await self.request(
+            "GET",
             "me/player",
             params={"market": market, "additional_types": "track,episode"},
         )
-        return models.Player.model_validate_json(player) if player is not None else None
+        return await self._parse(models.Player, player) if player else None
 
     @validator
     async def transfer_playback(
@@ -1046,7 +1288,7 @@ class API:
         play : bool, default False
             Whether or not to ensure playback happens on the specified device.
         """
-        await self.put("me/player", json={"device_ids": [device_id], "play": play})
+        await self.request("PUT", "me/player", json={"device_ids": [device_id], "play": play})
 
     @validator
     async def get_available_devices(self) -> list[models.Device]:
@@ -1061,9 +1303,8 @@ class API:
         list[models.Device]
             The available devices.
         """
-        devices = await self.get("me/player/devices")
-        assert devices is not None
-        return internals.Devices.model_validate_json(devices).devices
+        devices = await self.request("GET", "me/player/devices")
+        return (await self._parse(internals.Devices, devices)).devices
 
     @validator
     async def get_currently_playing_track(
@@ -1087,11 +1328,12 @@ class API:
         None
             If nothing is playing.
         """
-        player = await self.get(
+        player = await self.request(
+            "GET",
             "me/player/currently-playing",
             params={"market": market, "additional_types": "track,episode"},
         )
-        return models.PlayerTrack.model_validate_json(player) if player is not None else None
+        return await self._parse(models.PlayerTrack, player) if player else None
 
     @typing.overload
     async def start_or_resume_playback(
@@ -1152,15 +1394,14 @@ class API:
         position : datetime.timedelta, optional
             The position in the (first) item at which to start playback.
         """
-        final_offset = MISSING
-        if offset is not MISSING:
-            if isinstance(offset, int):
-                final_offset = {"position": offset}
-            else:
-                assert isinstance(offset, str)
-                final_offset = {"uri": offset}
+        offset_: MissingOr[dict[str, int | str]] = MISSING
+        if isinstance(offset, int):
+            offset_ = {"position": offset}
+        elif offset is not MISSING:
+            offset_ = {"uri": offset}
 
-        await self.put(
+        await self.request(
+            "PUT",
             "me/player/play",
             params={
                 "device_id": device_id,
@@ -1168,10 +1409,8 @@ class API:
             json={
                 "context_uri": context_uri,
                 "uris": track_uris,
-                "offset": final_offset,
-                "position_ms": position.total_seconds() * 1000
-                if position is not MISSING
-                else MISSING,
+                "offset": offset_,
+                "position_ms": position // _MILLISECOND if position is not MISSING else MISSING,
             },
         )
 
@@ -1190,7 +1429,11 @@ class API:
         device_id : str, optional
             The ID of the device this command is targeting. Default: currently active device.
         """
-        await self.put("me/player/pause", params={"device_id": device_id})
+        await self.request(
+            "PUT",
+            "me/player/pause",
+            params={"device_id": device_id} if device_id is not MISSING else None,
+        )
 
     @validator
     async def skip_to_next(self, *, device_id: MissingOr[str] = MISSING) -> None:
@@ -1207,7 +1450,11 @@ class API:
         device_id : str, optional
             The ID of the device this command is targeting. Default: currently active device.
         """
-        await self.post("me/player/next", params={"device_id": device_id})
+        await self.request(
+            "POST",
+            "me/player/next",
+            params={"device_id": device_id} if device_id is not MISSING else None,
+        )
 
     @validator
     async def skip_to_previous(self, *, device_id: MissingOr[str] = MISSING) -> None:
@@ -1224,7 +1471,11 @@ class API:
         device_id : str, optional
             The ID of the device this command is targeting. Default: currently active device.
         """
-        await self.post("me/player/previous", params={"device_id": device_id})
+        await self.request(
+            "POST",
+            "me/player/previous",
+            params={"device_id": device_id} if device_id is not MISSING else None,
+        )
 
     @validator
     async def seek_to_position(
@@ -1248,10 +1499,11 @@ class API:
         device_id : str, optional
             The ID of the device this command is targeting. Default: currently active device.
         """
-        await self.put(
+        await self.request(
+            "PUT",
             "me/player/seek",
             params={
-                "position_ms": position.total_seconds() * 1000,
+                "position_ms": position // _MILLISECOND,
                 "device_id": device_id,
             },
         )
@@ -1278,7 +1530,8 @@ class API:
         device_id : str, optional
             The ID of the device this command is targeting. Default: currently active device.
         """
-        await self.put(
+        await self.request(
+            "PUT",
             "me/player/repeat",
             params={"state": state.value, "device_id": device_id},
         )
@@ -1305,7 +1558,8 @@ class API:
         device_id : str, optional
             The ID of the device this command is targeting. Default: currently active device.
         """
-        await self.put(
+        await self.request(
+            "PUT",
             "me/player/volume",
             params={"volume_percent": volume_percent, "device_id": device_id},
         )
@@ -1329,7 +1583,8 @@ class API:
         device_id : str, optional
             The ID of the device this command is targeting. Default: currently active device.
         """
-        await self.put(
+        await self.request(
+            "PUT",
             "me/player/shuffle",
             params={"state": state, "device_id": device_id},
         )
@@ -1382,7 +1637,8 @@ class API:
         if after is not MISSING and before is not MISSING:
             raise ValueError("only one of `after` and `before` may be supplied")
 
-        played = await self.get(
+        played = await self.request(
+            "GET",
             "me/player/recently-played",
             params={
                 "limit": limit,
@@ -1390,10 +1646,7 @@ class API:
                 "before": int(before.timestamp() * 1000) if before is not MISSING else MISSING,
             },
         )
-        assert played is not None
-        return models.CursorPaginator[models.PlayHistory].from_payload(
-            played, self, models.PlayHistory
-        )
+        return await _PlayHistoryCursorPaginator.from_payload(played, self, models.PlayHistory)
 
     @validator
     async def get_users_queue(self) -> models.Queue:
@@ -1408,9 +1661,8 @@ class API:
         models.Queue
             The queue.
         """
-        queue = await self.get("me/player/queue")
-        assert queue is not None
-        return models.Queue.model_validate_json(queue)
+        queue = await self.request("GET", "me/player/queue")
+        return await self._parse(models.Queue, queue)
 
     @validator
     async def add_item_to_playback_queue(
@@ -1434,7 +1686,7 @@ class API:
         device_id : str, optional
             The ID of the device this command is targeting. Default: currently active device.
         """
-        await self.post("me/player/queue", params={"uri": uri, "device_id": device_id})
+        await self.request("POST", "me/player/queue", params={"uri": uri, "device_id": device_id})
 
     # TODO: create a helper object for the query field
     @validator
@@ -1473,7 +1725,8 @@ class API:
         models.Playlist
             The requested playlist.
         """
-        playlist = await self.get(
+        playlist = await self.request(
+            "GET",
             f"playlists/{playlist_id}",
             params={
                 "market": market,
@@ -1481,8 +1734,7 @@ class API:
                 "additional_types_": "track,episode",
             },
         )
-        assert playlist is not None
-        return models.Playlist.model_validate_json(playlist)
+        return await self._parse(models.Playlist, playlist)
 
     @validator
     async def change_playlist_details(
@@ -1522,7 +1774,8 @@ class API:
                 The Spotify Web API is bugged, and does not allow you to clear the description field
                 through the API. Setting it to `None`, `""` or even `False` will have no effect.
         """
-        await self.put(
+        await self.request(
+            "PUT",
             f"playlists/{playlist_id}",
             json={
                 "name": name,
@@ -1574,7 +1827,8 @@ class API:
         offset : int, default: 0
             The index of the first item to return. Default: 0 (the first item).
         """
-        items = await self.get(
+        items = await self.request(
+            "GET",
             f"playlists/{playlist_id}/tracks",
             params={
                 "market": market,
@@ -1584,8 +1838,80 @@ class API:
                 "additional_types_": "track,episode",
             },
         )
-        assert items is not None
-        return models.Paginator[models.PlaylistItem].from_payload(items, self, models.PlaylistItem)
+        return await _PlaylistItemPaginator.from_payload(items, self, models.PlaylistItem)
+
+    async def iter_all_playlist_items(
+        self,
+        playlist_id: str,
+        *,
+        market: MissingOr[str] = MISSING,
+        limit: int = 50,
+        concurrency: int = 10,
+    ) -> AsyncGenerator[models.PlaylistItem]:
+        """Iterate over all the items of a playlist.
+
+        Once the first page has been fetched and the total is known, up to `concurrency` of the
+        following pages are requested ahead of time, and their items are yielded in playlist order.
+
+        !!! scopes "Optional Authorization Scope"
+            [`PLAYLIST_READ_PRIVATE`][spotify.enums.Scope.PLAYLIST_READ_PRIVATE] - required to
+            access a private playlist belonging to the current user.
+
+        Parameters
+        ----------
+        playlist_id : str
+            The ID of the playlist.
+        market : str, optional
+            Only get content available in that market.
+            Must be an [ISO 3166-1 alpha-2 country code](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2).
+        limit : int, default: 50
+            The number of items to request per page. Minimum: 1. Maximum: 50.
+        concurrency : int, default: 10
+            The maximum number of pages to request at once. Minimum: 1.
+
+        Returns
+        -------
+        collections.abc.AsyncGenerator[models.PlaylistItem]
+            An async generator of the playlist's items.
+        """
+        if concurrency < 1:
+            raise ValueError("`concurrency` must be at least 1")
+
+        first = await self.get_playlist_items(playlist_id, market=market, limit=limit)
+        for item in first.items:
+            yield item
+
+        offsets = iter(range(limit, first.total, limit))
+        pages: collections.deque[asyncio.Task[models.Paginator[models.PlaylistItem]]] = (
+            collections.deque()
+        )
+
+        def fetch_next() -> None:
+            offset = next(offsets, None)
+            if offset is not None:
+                pages.append(
+                    asyncio.create_task(
+                        self.get_playlist_items(
+                            playlist_id, market=market, limit=limit, offset=offset
+                        )
+                    )
+                )
+
+        for _ in range(concurrency):
+            fetch_next()
+
+        try:
+            while pages:
+                items = (await pages[0]).items
+                pages.popleft()
+                fetch_next()
+                for item in items:
+                    yield item
+        finally:
+            for page in pages:
+                page.cancel()
+            # retrieve the outcome of every unfinished page, so no exception goes unreported
+            await asyncio.gather(*pages, return_exceptions=True)
 
     # TODO: split replace and reorder into their own overloads
     @validator
@@ -1640,7 +1966,8 @@ class API:
         * To move the items at index 9-10 to the start of the playlist:
             Set `range_start` to `9`, `range_length` to `2` and `insert_before` to `0`
         """
-        snapshot_id_ = await self.put(
+        snapshot_id_ = await self.request(
+            "PUT",
             f"playlists/{playlist_id}/tracks",
             params={
                 "uris": uris,
@@ -1652,8 +1979,7 @@ class API:
                 "snapshot_id": snapshot_id,
             },
         )
-        assert snapshot_id_ is not None
-        return internals.SnapshotID.model_validate_json(snapshot_id_).snapshot_id
+        return (await self._parse(internals.SnapshotID, snapshot_id_)).snapshot_id
 
     @validator
     async def add_items_to_playlist(
@@ -1685,15 +2011,15 @@ class API:
         str
             A snapshot ID for the new playlist version.
         """
-        snapshot_id = await self.post(
+        snapshot_id = await self.request(
+            "POST",
             f"playlists/{playlist_id}/tracks",
             json={
                 "position": position,
                 "uris": uris,
             },
         )
-        assert snapshot_id is not None
-        return internals.SnapshotID.model_validate_json(snapshot_id).snapshot_id
+        return (await self._parse(internals.SnapshotID, snapshot_id)).snapshot_id
 
     @validator
     async def remove_playlist_items(
@@ -1725,13 +2051,17 @@ class API:
         str
             A snapshot ID for the new playlist version.
         """
-        tracks = [{"uri": uri} for uri in uris]
-        snapshot_id_ = await self.delete(
+        # the body is templated directly rather than building and serializing a dict per URI
+        tracks = _comma_join([f'{{"uri":{_encode_json_str(uri)}}}' for uri in uris])
+        snapshot = (
+            f',"snapshot_id":{_encode_json_str(snapshot_id)}' if snapshot_id is not MISSING else ""
+        )
+        snapshot_id_ = await self.request(
+            "DELETE",
             f"playlists/{playlist_id}/tracks",
-            json={"tracks": tracks, "snapshot_id": snapshot_id},
+            data=f'{{"tracks":[{tracks}]{snapshot}}}'.encode(),
         )
-        assert snapshot_id_ is not None
-        return internals.SnapshotID.model_validate_json(snapshot_id_).snapshot_id
+        return (await self._parse(internals.SnapshotID, snapshot_id_)).snapshot_id
 
     @validator
     async def get_current_users_playlists(
@@ -1758,17 +2088,15 @@ class API:
         models.Paginator[models.SimplePlaylist]
             The requested playlists.
         """
-        playlists = await self.get(
+        playlists = await self.request(
+            "GET",
             "me/playlists",
             params={
                 "limit": limit,
                 "offset": offset,
             },
         )
-        assert playlists is not None
-        return models.Paginator[models.SimplePlaylist].from_payload(
-            playlists, self, models.SimplePlaylist
-        )
+        return await _SimplePlaylistPaginator.from_payload(playlists, self, models.SimplePlaylist)
 
     @validator
     async def get_users_playlists(
@@ -1800,17 +2128,15 @@ class API:
         models.Paginator[models.SimplePlaylist]
             The requested playlists.
         """
-        playlists = await self.get(
+        playlists = await self.request(
+            "GET",
             f"users/{user_id}/playlists",
             params={
                 "limit": limit,
                 "offset": offset,
             },
         )
-        assert playlists is not None
-        return models.Paginator[models.SimplePlaylist].from_payload(
-            playlists, self, models.SimplePlaylist
-        )
+        return await _SimplePlaylistPaginator.from_payload(playlists, self, models.SimplePlaylist)
 
     @validator
     async def create_playlist(
@@ -1855,7 +2181,8 @@ class API:
         models.Playlist
             The newly created playlist.
         """
-        playlist = await self.post(
+        playlist = await self.request(
+            "POST",
             f"users/{user_id}/playlists",
             params={
                 "user_id": user_id,
@@ -1867,8 +2194,7 @@ class API:
                 "description": description,
             },
         )
-        assert playlist is not None
-        return models.Playlist.model_validate_json(playlist)
+        return await self._parse(models.Playlist, playlist)
 
     @validator
     async def get_featured_playlists(
@@ -1894,7 +2220,8 @@ class API:
         models.Playlists
             The requested playlists.
         """
-        playlists = await self.get(
+        playlists = await self.request(
+            "GET",
             "browse/featured-playlists",
             params={
                 "locale": locale,
@@ -1902,8 +2229,7 @@ class API:
                 "offset": offset,
             },
         )
-        assert playlists is not None
-        return models.Playlists.model_validate_json(playlists)
+        return await self._parse(models.Playlists, playlists)
 
     @validator
     async def get_categorys_playlists(
@@ -1929,15 +2255,15 @@ class API:
         models.Playlists
             The requested playlists.
         """
-        playlists = await self.get(
+        playlists = await self.request(
+            "GET",
             f"browse/categories/{category_id}/playlists",
             params={
                 "limit": limit,
                 "offset": offset,
             },
         )
-        assert playlists is not None
-        return models.Playlists.model_validate_json(playlists)
+        return await self._parse(models.Playlists, playlists)
 
     @validator
     async def get_playlist_cover_image(
@@ -1956,10 +2282,11 @@ class API:
         list[models.Image]
             The playlist cover image, potentially in different sizes.
         """
-        images = await self.get(f"playlists/{playlist_id}/images")
-        assert images is not None
-        img_list: list[dict[str, str | int]] = json_.loads(images)
-        return [models.Image(**img) for img in img_list]  # pyright: ignore[reportArgumentType]
+        images = await self.request("GET", f"playlists/{playlist_id}/images")
+        if self._validate:
+            return _IMAGE_LIST_ADAPTER.validate_json(images)
+
+        return [utils.construct_model(models.Image, image) for image in json_.loads(images)]
 
     @validator
     async def add_custom_playlist_cover_image(
@@ -1987,8 +2314,9 @@ class API:
         image : bytes
             JPEG image data, in bytes. Maximum size is 256 KB.
         """
-        image = base64.encodebytes(image).replace(b"\n", b"")
-        await self.put(
+        image = base64.b64encode(image)
+        await self.request(
+            "PUT",
             f"playlists/{playlist_id}/images",
             data=image,
         )
@@ -2075,63 +2403,52 @@ class API:
         if start_year is MISSING and end_year is not MISSING:
             raise ValueError("end_year cannot be provided without start_year")
 
-        if start_year is not MISSING and end_year is not MISSING:
-            final_year = f"year:{start_year}-{end_year}"
-        elif start_year is not MISSING:
-            final_year = f"year:{start_year}"
-        else:
-            final_year = MISSING
-
-        final_album = f"album:{album}" if album is not MISSING else MISSING
-        final_artist = f"artist:{artist}" if artist is not MISSING else MISSING
-        final_track = f"track:{track}" if track is not MISSING else MISSING
-        final_upc = f"upc:{upc}" if upc is not MISSING else MISSING
-        final_hipster = "tag:hipster" if hipster is not MISSING and hipster is True else MISSING
-        final_new = "tag:new" if new is not MISSING and new is True else MISSING
-        final_isrc = f"isrc:{isrc}" if isrc is not MISSING else MISSING
-        final_genre = (
-            f"genre:{' '.join(genres)}" if genres is not MISSING and len(genres) > 0 else MISSING
-        )
+        parts: list[str] = []
+        if query is not MISSING:
+            parts.append(query)
+        if album is not MISSING:
+            parts.append(f"album:{album}")
+        if artist is not MISSING:
+            parts.append(f"artist:{artist}")
+        if track is not MISSING:
+            parts.append(f"track:{track}")
+        if upc is not MISSING:
+            parts.append(f"upc:{upc}")
+        if hipster is True:
+            parts.append("tag:hipster")
+        if new is True:
+            parts.append("tag:new")
+        if isrc is not MISSING:
+            parts.append(f"isrc:{isrc}")
+        if genres:
+            parts.append(f"genre:{' '.join(genres)}")
+        if start_year is not MISSING:
+            parts.append(
+                f"year:{start_year}-{end_year}"
+                if end_year is not MISSING
+                else f"year:{start_year}"
+            )
 
-        final_query = " ".join(
-            [
-                item
-                for item in [
-                    query,
-                    final_album,
-                    final_artist,
-                    final_track,
-                    final_upc,
-                    final_hipster,
-                    final_new,
-                    final_isrc,
-                    final_genre,
-                    final_year,
-                ]
-                if item is not MISSING
-            ]
-        )
+        final_query = " ".join(parts)
 
         if not final_query.strip():
             raise ValueError(
                 "one of `query`, `album`, `artist`, `track`, `start_year`, `upc`, `hipster`, `new`, `isrc` or `genres` must be provided"
             )
 
-        results = await self.get(
+        results = await self.request(
+            "GET",
             "search",
             params={
                 "q": final_query,
-                "type": ",".join([t.value for t in types]),
+                "type": _comma_join(map(_enum_value, types)),
                 "market": market,
                 "limit": limit,
                 "offset": offset,
-                "include_external": "audio"
-                if include_external is not MISSING and include_external is True
-                else MISSING,
+                "include_external": "audio" if include_external is True else MISSING,
             },
         )
-        assert results is not None
-        return models.SearchResult.model_validate_json(results)
+        return await self._parse(models.SearchResult, results)
 
     @validator
     async def get_show(self, show_id: str, *, market: MissingOr[str] = MISSING) -> models.Show:
@@ -2150,9 +2467,8 @@ class API:
         models.Show
             The requested show.
         """
-        show = await self.get(f"shows/{show_id}", params={"market": market})
-        assert show is not None
-        return models.Show.model_validate_json(show)
+        show = await self.request("GET", f"shows/{show_id}", params={"market": market})
+        return await self._parse(models.Show, show)
 
     @validator
     async def get_several_shows(
@@ -2173,9 +2489,13 @@ class API:
         list[models.SimpleShow]
             The requested shows.
         """
-        shows = await self.get("shows", params={"ids": ",".join(show_ids), "market": market})
-        assert shows is not None
-        return internals.Shows.model_validate_json(shows).shows
+        if not show_ids:
+            return []
+
+        shows = await self.request(
+            "GET", "shows", params={"ids": _comma_join(show_ids), "market": market}
+        )
+        return (await self._parse(internals.Shows, shows)).shows
 
     @validator
     async def get_show_episodes(
@@ -2205,14 +2525,12 @@ class API:
         models.Paginator[models.SimpleEpisode]
             A paginator who's items are a list of episodes.
         """
-        episodes = await self.get(
+        episodes = await self.request(
+            "GET",
             f"shows/{show_id}/episodes",
             params={"limit": limit, "offset": offset, "market": market},
         )
-        assert episodes is not None
-        return models.Paginator[models.SimpleEpisode].from_payload(
-            episodes, self, models.SimpleEpisode
-        )
+        return await _SimpleEpisodePaginator.from_payload(episodes, self, models.SimpleEpisode)
 
     @validator
     async def get_users_saved_shows(
@@ -2238,12 +2556,12 @@ class API:
         models.Paginator[models.SavedShow]
             A paginator who's items are a list of shows.
         """
-        shows = await self.get(
+        shows = await self.request(
+            "GET",
             "me/shows",
             params={"limit": limit, "offset": offset},
         )
-        assert shows is not None
-        return models.Paginator[models.SavedShow].from_payload(shows, self, models.SavedShow)
+        return await _SavedShowPaginator.from_payload(shows, self, models.SavedShow)
 
     @validator
     async def save_shows_for_current_user(
@@ -2260,7 +2578,10 @@ class API:
         show_ids : list[str]
             The IDs of the shows. Maximum: 50.
         """
-        await self.put("me/shows", params={"ids": ",".join(show_ids)})
+        if not show_ids:
+            return
+
+        await self.request("PUT", "me/shows", params={"ids": _comma_join(show_ids)})
 
     @validator
     async def remove_users_saved_shows(
@@ -2279,7 +2600,12 @@ class API:
             Only modify content available in that market.
             Must be an [ISO 3166-1 alpha-2 country code](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2).
         """
-        await self.delete("me/shows", params={"ids": ",".join(show_ids), "market": market})
+        if not show_ids:
+            return
+
+        await self.request(
+            "DELETE", "me/shows", params={"ids": _comma_join(show_ids), "market": market}
+        )
 
     @validator
     async def check_users_saved_shows(self, show_ids: list[str]) -> list[bool]:
@@ -2298,9 +2624,13 @@ class API:
         list[bool]
             A list of booleans dictating whether or not the corresponding shows are already saved.
         """
-        shows = await self.get("me/shows/contains", params={"ids": ",".join(show_ids)})
-        assert shows is not None
-        return json_.loads(shows)
+        if not show_ids:
+            return []
+
+        shows = await self.request(
+            "GET", "me/shows/contains", params={"ids": _comma_join(show_ids)}
+        )
+        return utils.parse_bool_list(shows)
 
     @validator
     async def get_track(
@@ -2321,9 +2651,8 @@ class API:
         models.TrackWithSimpleArtist
             The requested track.
         """
-        track = await self.get(f"tracks/{track_id}", params={"market": market})
-        assert track is not None
-        return models.TrackWithSimpleArtist.model_validate_json(track)
+        track = await self.request("GET", f"tracks/{track_id}", params={"market": market})
+        return await self._parse(models.TrackWithSimpleArtist, track)
 
     @validator
     async def get_several_tracks(
@@ -2344,9 +2673,13 @@ class API:
         list[models.TrackWithSimpleArtist]
             The requested tracks.
         """
-        tracks = await self.get("tracks", params={"ids": ",".join(track_ids), "market": market})
-        assert tracks is not None
-        return internals.Tracks.model_validate_json(tracks).tracks
+        if not track_ids:
+            return []
+
+        tracks = await self.request(
+            "GET", "tracks", params={"ids": _comma_join(track_ids), "market": market}
+        )
+        return (await self._parse(internals.Tracks, tracks)).tracks
 
     @validator
     async def get_users_saved_tracks(
@@ -2376,12 +2709,12 @@ class API:
         models.Paginator[models.SavedTrack]
             A paginator who's items are a list of tracks.
         """
-        tracks = await self.get(
+        tracks = await self.request(
+            "GET",
             "me/tracks",
             params={"limit": limit, "offset": offset, "market": market},
         )
-        assert tracks is not None
-        return models.Paginator[models.SavedTrack].from_payload(tracks, self, models.SavedTrack)
+        return await _SavedTrackPaginator.from_payload(tracks, self, models.SavedTrack)
 
     @validator
     async def save_tracks_for_current_user(
@@ -2396,9 +2729,15 @@ class API:
         Parameters
         ----------
         track_ids : list[str]
-            The IDs of the tracks. Maximum: 50.
+            The IDs of the tracks. Any number of IDs may be given; they are sent in batches of 50.
+            Batches are sent one after another, stopping at the first that fails; the batches
+            sent before it remain applied.
         """
-        await self.put("me/tracks", params={"ids": ",".join(track_ids)})
+
+        async def save(ids: list[str]) -> None:
+            await self.request("PUT", "me/tracks", params={"ids": _comma_join(ids)})
+
+        await self._chunked(save, track_ids, concurrency=1)
 
     @validator
     async def remove_users_saved_tracks(self, track_ids: list[str]) -> None:
@@ -2410,9 +2749,15 @@ class API:
         Parameters
         ----------
         track_ids : list[str]
-            The IDs of the tracks. Maximum: 50.
+            The IDs of the tracks. Any number of IDs may be given; they are sent in batches of 50.
+            Batches are sent one after another, stopping at the first that fails; the batches
+            sent before it remain applied.
         """
-        await self.delete("me/tracks", params={"ids": ",".join(track_ids)})
+
+        async def remove(ids: list[str]) -> None:
+            await self.request("DELETE", "me/tracks", params={"ids": _comma_join(ids)})
+
+        await self._chunked(remove, track_ids, concurrency=1)
 
     @validator
     async def check_users_saved_tracks(self, track_ids: list[str]) -> list[bool]:
@@ -2424,16 +2769,21 @@ class API:
         Parameters
         ----------
         track_ids : list[str]
-            The IDs of the tracks. Maximum: 50.
+            The IDs of the tracks. Any number of IDs may be given; they are sent in batches of 50.
 
         Returns
         -------
         list[bool]
             A list of booleans dictating whether or not the corresponding tracks are already saved.
         """
-        tracks = await self.get("me/tracks/contains", params={"ids": ",".join(track_ids)})
-        assert tracks is not None
-        return json_.loads(tracks)
+
+        async def check(ids: list[str]) -> list[bool]:
+            tracks = await self.request(
+                "GET", "me/tracks/contains", params={"ids": _comma_join(ids)}
+            )
+            return utils.parse_bool_list(tracks)
+
+        return list(itertools.chain.from_iterable(await self._chunked(check, track_ids)))
 
     @validator
     async def get_tracks_audio_features(self, track_id: str) -> models.AudioFeatures:
@@ -2449,9 +2799,8 @@ class API:
         models.AudioFeatures
             The track's audio features.
         """
-        features = await self.get(f"audio-features/{track_id}")
-        assert features is not None
-        return models.AudioFeatures.model_validate_json(features)
+        features = await self.request("GET", f"audio-features/{track_id}")
+        return await self._parse(models.AudioFeatures, features)
 
     @validator
     async def get_several_tracks_audio_features(
@@ -2469,9 +2818,13 @@ class API:
         list[models.AudioFeatures]
             The tracks' audio features.
         """
-        features = await self.get("audio-features", params={"ids": ",".join(track_ids)})
-        assert features is not None
-        return internals.AudioFeatures.model_validate_json(features).audio_features
+        if not track_ids:
+            return []
+
+        features = await self.request(
+            "GET", "audio-features", params={"ids": _comma_join(track_ids)}
+        )
+        return (await self._parse(internals.AudioFeatures, features)).audio_features
 
     @validator
     async def get_tracks_audio_analysis(self, track_id: str) -> models.AudioAnalysis:
@@ -2489,11 +2842,11 @@ class API:
         models.AudioAnalysis
             The track's audio analysis.
         """
-        analysis = await self.get(f"audio-analysis/{track_id}")
-        assert analysis is not None
-        return models.AudioAnalysis.model_validate_json(analysis)
+        analysis = await self.request("GET", f"audio-analysis/{track_id}")
+        return await self._parse(models.AudioAnalysis, analysis)
 
     @validator
+    @ttl_cache(300, maxsize=256, enabled=operator.attrgetter("_cache_recommendations"))
     async def get_recommendations(
         self,
         seed_artists: MissingOr[list[str]] = MISSING,
@@ -2547,6 +2900,9 @@ class API:
     ) -> models.Recommendations:
         """Get recommendations based on other artists, genres and/or tracks.
 
+        If `cache_recommendations` was enabled on the client, the result is cached for 5
+        minutes for each set of arguments.
+
         !!! note
             One of `seed_artists`, `seed_genres` and `seed_tracks` must be provided.
             Up to 5 seed values may be provided in any combination of `seed_artists`,
@@ -2658,12 +3014,13 @@ class API:
                 "one of `seed_artists`, `seed_genres` and `seed_tracks` must be provided"
             )
 
-        recommendations = await self.get(
+        recommendations = await self.request(
+            "GET",
             "recommendations",
             params={
-                "seed_artists": seed_artists,
-                "seed_genres": seed_genres,
-                "seed_tracks": seed_tracks,
+                "seed_artists": _comma_join(seed_artists) if seed_artists else MISSING,
+                "seed_genres": _comma_join(seed_genres) if seed_genres else MISSING,
+                "seed_tracks": _comma_join(seed_tracks) if seed_tracks else MISSING,
                 "limit": limit,
                 "market": market,
                 "min_acousticness": min_acousticness,
@@ -2672,13 +3029,13 @@ class API:
                 "min_danceability": min_danceability,
                 "max_danceability": max_danceability,
                 "target_danceability": target_danceability,
-                "min_duration_ms": min_duration.total_seconds() * 1000
+                "min_duration_ms": min_duration // _MILLISECOND
                 if min_duration is not MISSING
                 else MISSING,
-                "max_duration_ms": max_duration.total_seconds() * 1000
+                "max_duration_ms": max_duration // _MILLISECOND
                 if max_duration is not MISSING
                 else MISSING,
-                "target_duration_ms": target_duration.total_seconds() * 1000
+                "target_duration_ms": target_duration // _MILLISECOND
                 if target_duration is not MISSING
                 else MISSING,
                 "min_energy": min_energy,
@@ -2716,8 +3073,7 @@ class API:
                 "target_valence": target_valence,
             },
         )
-        assert recommendations is not None
-        return models.Recommendations.model_validate_json(recommendations)
+        return await self._parse(models.Recommendations, recommendations)
 
     @validator
     async def get_current_users_profile(self) -> models.OwnUser:
@@ -2734,9 +3090,8 @@ class API:
         models.OwnUser
             The current user.
         """
-        user = await self.get("me")
-        assert user is not None
-        return models.OwnUser.model_validate_json(user)
+        user = await self.request("GET", "me")
+        return await self._parse(models.OwnUser, user)
 
     @typing.overload
     async def get_users_top_items(
@@ -2769,6 +3124,9 @@ class API:
     ) -> models.Paginator[models.Artist] | models.Paginator[models.TrackWithSimpleArtist]:
         """Get the current user's top artists or tracks based on calculated affinity.
 
+        See also [`get_users_top_artists`][spotify.api.API.get_users_top_artists] and
+        [`get_users_top_tracks`][spotify.api.API.get_users_top_tracks].
+
         !!! scopes "Required Authorization Scope"
             [`USER_TOP_READ`][spotify.enums.Scope.USER_TOP_READ]
 
@@ -2790,22 +3148,91 @@ class API:
         models.Paginator[models.TrackWithSimpleArtist]
             A paginator who's items are a list of tracks.
         """
-        items = await self.get(
-            f"me/top/{type.value}",
+        if type is enums.TopItemType.ARTISTS:
+            return await self.get_users_top_artists(
+                limit=limit, offset=offset, time_range=time_range
+            )
+
+        return await self.get_users_top_tracks(limit=limit, offset=offset, time_range=time_range)
+
+    @validator
+    async def get_users_top_artists(
+        self,
+        *,
+        limit: MissingOr[int] = MISSING,
+        offset: MissingOr[int] = MISSING,
+        time_range: MissingOr[enums.TimeRange] = MISSING,
+    ) -> models.Paginator[models.Artist]:
+        """Get the current user's top artists based on calculated affinity.
+
+        !!! scopes "Required Authorization Scope"
+            [`USER_TOP_READ`][spotify.enums.Scope.USER_TOP_READ]
+
+        Parameters
+        ----------
+        limit : int, default: 20
+            The maximum number of items to return. Default: 20. Minimum: 1. Maximum: 50.
+        offset : int, default: 0
+            The index of the first item to return. Default: 0 (the first item)
+        time_range : enums.TimeRange, default: Medium Term
+            Over what time frame the affinities are computed.
+
+        Returns
+        -------
+        models.Paginator[models.Artist]
+            A paginator who's items are a list of artists.
+        """
+        items = await self._get_users_top_items("me/top/artists", limit, offset, time_range)
+        return await _ArtistPaginator.from_payload(items, self, models.Artist)
+
+    @validator
+    async def get_users_top_tracks(
+        self,
+        *,
+        limit: MissingOr[int] = MISSING,
+        offset: MissingOr[int] = MISSING,
+        time_range: MissingOr[enums.TimeRange] = MISSING,
+    ) -> models.Paginator[models.TrackWithSimpleArtist]:
+        """Get the current user's top tracks based on calculated affinity.
+
+        !!! scopes "Required Authorization Scope"
+            [`USER_TOP_READ`][spotify.enums.Scope.USER_TOP_READ]
+
+        Parameters
+        ----------
+        limit : int, default: 20
+            The maximum number of items to return. Default: 20. Minimum: 1. Maximum: 50.
+        offset : int, default: 0
+            The index of the first item to return. Default: 0 (the first item)
+        time_range : enums.TimeRange, default: Medium Term
+            Over what time frame the affinities are computed.
+
+        Returns
+        -------
+        models.Paginator[models.TrackWithSimpleArtist]
+            A paginator who's items are a list of tracks.
+        """
+        items = await self._get_users_top_items("me/top/tracks", limit, offset, time_range)
+        return await _TrackWithSimpleArtistPaginator.from_payload(
+            items, self, models.TrackWithSimpleArtist
+        )
+
+    async def _get_users_top_items(
+        self,
+        url: str,
+        limit: MissingOr[int],
+        offset: MissingOr[int],
+        time_range: MissingOr[enums.TimeRange],
+    ) -> bytes:
+        return await self.request(
+            "GET",
+            url,
             params={
                 "limit": limit,
                 "offset": offset,
                 "time_range": time_range.value if time_range is not MISSING else MISSING,
             },
         )
-        assert items is not None
-        if type is enums.TopItemType.ARTISTS:
-            return models.Paginator[models.Artist].from_payload(items, self, models.Artist)
-        else:
-            assert type is enums.TopItemType.TRACKS
-            return models.Paginator[models.TrackWithSimpleArtist].from_payload(
-                items, self, models.TrackWithSimpleArtist
-            )
 
     @validator
     async def get_users_profile(
@@ -2824,9 +3251,8 @@ class API:
         models.User
             The requested user.
         """
-        user = await self.get(f"users/{user_id}")
-        assert user is not None
-        return models.User.model_validate_json(user)
+        user = await self.request("GET", f"users/{user_id}")
+        return await self._parse(models.User, user)
 
     @validator
     async def follow_playlist(
@@ -2849,7 +3275,7 @@ class API:
         public : bool, default: True
             Whether or not the playlist will be included in the user's public playlists (added to profile).
         """
-        await self.put(f"playlists/{playlist_id}/followers", json={"public": public})
+        await self.request("PUT", f"playlists/{playlist_id}/followers", json={"public": public})
 
     @validator
     async def unfollow_playlist(
@@ -2869,7 +3295,7 @@ class API:
         playlist_id : str
             The ID of the playlist.
         """
-        await self.delete(f"playlists/{playlist_id}/followers")
+        await self.request("DELETE", f"playlists/{playlist_id}/followers")
 
     @validator
     async def get_followed_artists(
@@ -2894,12 +3320,12 @@ class API:
         models.CursorPaginator[models.Artist]
             A paginator who's items are a list of artists.
         """
-        followed = await self.get(
+        followed = await self.request(
+            "GET",
             "me/following",
             params={"type": "artist", "after": after, "limit": limit},
         )
-        assert followed is not None
-        return internals.ArtistsPaginator.from_payload(followed, self).paginator
+        return (await internals.ArtistsPaginator.from_payload(followed, self)).paginator
 
     @validator
     async def follow_artists_or_users(
@@ -2915,11 +3341,19 @@ class API:
         Parameters
         ----------
         ids : list[str]
-            The IDs of the artists. Maximum: 50.
+            The IDs of the artists. Any number of IDs may be given; they are sent in batches of 50.
+            Batches are sent one after another, stopping at the first that fails; the batches
+            sent before it remain applied.
         type : enums.UserType
             The user type (user/artist).
         """
-        await self.put("me/following", params={"ids": ",".join(ids), "type": type.value})
+
+        async def follow(ids: list[str]) -> None:
+            await self.request(
+                "PUT", "me/following", params={"ids": _comma_join(ids), "type": type.value}
+            )
+
+        await self._chunked(follow, ids, concurrency=1)
 
     @validator
     async def unfollow_artists_or_users(self, ids: list[str], type: enums.UserType) -> None:
@@ -2931,11 +3365,19 @@ class API:
         Parameters
         ----------
         ids : list[str]
-            The IDs of the artists. Maximum: 50.
+            The IDs of the artists. Any number of IDs may be given; they are sent in batches of 50.
+            Batches are sent one after another, stopping at the first that fails; the batches
+            sent before it remain applied.
         type : enums.UserType
             The user type (user/artist).
         """
-        await self.delete("me/following", params={"ids": ",".join(ids), "type": type.value})
+
+        async def unfollow(ids: list[str]) -> None:
+            await self.request(
+                "DELETE", "me/following", params={"ids": _comma_join(ids), "type": type.value}
+            )
+
+        await self._chunked(unfollow, ids, concurrency=1)
 
     @validator
     async def check_if_user_follows_artists_or_users(
@@ -2951,7 +3393,7 @@ class API:
         Parameters
         ----------
         ids : list[str]
-            The IDs of the artists. Maximum: 50.
+            The IDs of the artists. Any number of IDs may be given; they are sent in batches of 50.
         type : enums.UserType
             The user type (user/artist).
 
@@ -2960,12 +3402,16 @@ class API:
         list[bool]
             A list of booleans dictating whether or not the current user has followed the corresponding users or artists.
         """
-        follows = await self.get(
-            "me/following/contains",
-            params={"ids": ",".join(ids), "type": type.value},
-        )
-        assert follows is not None
-        return json_.loads(follows)
+
+        async def check(ids: list[str]) -> list[bool]:
+            follows = await self.request(
+                "GET",
+                "me/following/contains",
+                params={"ids": _comma_join(ids), "type": type.value},
+            )
+            return utils.parse_bool_list(follows)
+
+        return list(itertools.chain.from_iterable(await self._chunked(check, ids)))
 
     @validator
     async def check_if_current_user_follows_playlist(
@@ -2987,11 +3433,11 @@ class API:
         bool
             Whether or not the current user is following the playlist.
         """
-        follows = await self.get(
+        follows = await self.request(
+            "GET",
             f"playlists/{playlist_id}/followers/contains",
         )
-        assert follows is not None
-        return json_.loads(follows)[0]
+        return utils.parse_bool_list(follows)[0]
 
 
 # MIT License
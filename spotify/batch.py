@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+from spotify import errors
+from spotify.types import MISSING, MissingOr
+
+if typing.TYPE_CHECKING:
+    from spotify import api, models
+
+__all__: typing.Sequence[str] = ("BatchedAPI",)
+
+T = typing.TypeVar("T")
+
+
+def _caused_by_single_id(exception: Exception) -> bool:
+    # Spotify rejects a whole batch when one of its IDs is malformed (400) or unknown (404), and an
+    # unavailable item comes back as `null`, failing validation. Anything else (rate limiting,
+    # authorization, server or connection errors) would fail for each ID on its own just the same.
+    if isinstance(exception, errors.APIError):
+        return exception.status in (400, 404)
+    return isinstance(exception, errors.InvalidPayloadError)
+
+
+class _Batcher(typing.Generic[T]):
+    """Collects single ID lookups and resolves them with one batched request."""
+
+    __slots__ = ("_fetch", "_max_size", "_delay", "_pending", "_timer", "_tasks")
+
+    def __init__(
+        self,
+        fetch: typing.Callable[[list[str]], typing.Awaitable[list[T]]],
+        max_size: int,
+        delay: float,
+    ) -> None:
+        self._fetch = fetch
+        self._max_size = max_size
+        self._delay = delay
+        self._pending: list[tuple[str, asyncio.Future[T]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        # keep references to in-flight batches so they aren't garbage collected
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, id: str) -> T:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[T] = loop.create_future()
+        self._pending.append((id, future))
+
+        if len(self._pending) >= self._max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._delay, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future[T]]]) -> None:
+        try:
+            results = await self._fetch([id for id, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            if len(batch) > 1 and _caused_by_single_id(e):
+                # retry each ID on its own, so only the callers of the failing IDs get the error
+                await asyncio.gather(*(self._run([pending]) for pending in batch))
+            else:
+                self._fail(batch, e)
+            return
+
+        if len(results) != len(batch):
+            self._fail(
+                batch,
+                errors.InvalidPayloadError(
+                    f"expected {len(batch)} results in batched response, received {len(results)}"
+                ),
+            )
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _fail(self, batch: list[tuple[str, asyncio.Future[T]]], exception: Exception) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(exception)
+
+
+class BatchedAPI:
+    """Coalesce concurrent single item lookups into batched API requests.
+
+    Lookups made within `delay` seconds of each other are sent as one request
+    of up to 50 IDs, and each caller receives only its own result. If a batched request fails
+    because of an invalid or unavailable ID, its IDs are retried one at a time, so that ID only
+    fails its own lookup. Any other error, such as being rate limited, is raised to every caller
+    in the batch.
+
+    Parameters
+    ----------
+    api : spotify.API
+        The API client used to make requests.
+    delay : float, default: 0.002
+        How long to wait, in seconds, for further lookups before sending a batch.
+    market : str, optional
+        Only get content available in that market.
+        Must be an [ISO 3166-1 alpha-2 country code](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2).
+    """
+
+    __slots__ = ("api", "_saved_shows", "_saved_tracks", "_tracks", "_shows")
+
+    def __init__(
+        self, api: api.API, *, delay: float = 0.002, market: MissingOr[str] = MISSING
+    ) -> None:
+        self.api = api
+
+        async def get_several_tracks(
+            ids: list[str],
+        ) -> list[models.TrackWithSimpleArtist]:
+            return await api.get_several_tracks(ids, market=market)
+
+        async def get_several_shows(ids: list[str]) -> list[models.SimpleShow]:
+            return await api.get_several_shows(ids, market=market)
+
+        self._saved_shows = _Batcher(api.check_users_saved_shows, 50, delay)
+        self._saved_tracks = _Batcher(api.check_users_saved_tracks, 50, delay)
+        self._tracks = _Batcher(get_several_tracks, 50, delay)
+        self._shows = _Batcher(get_several_shows, 50, delay)
+
+    async def check_users_saved_show(self, show_id: str) -> bool:
+        """Check if a show is saved in the current user's library.
+
+        Parameters
+        ----------
+        show_id : str
+            The ID of the show.
+
+        Returns
+        -------
+        bool
+            Whether the show is saved.
+        """
+        return await self._saved_shows.submit(show_id)
+
+    async def check_users_saved_track(self, track_id: str) -> bool:
+        """Check if a track is saved in the current user's library.
+
+        Parameters
+        ----------
+        track_id : str
+            The ID of the track.
+
+        Returns
+        -------
+        bool
+            Whether the track is saved.
+        """
+        return await self._saved_tracks.submit(track_id)
+
+    async def get_track(self, track_id: str) -> models.TrackWithSimpleArtist:
+        """Get Spotify catalog information for a track.
+
+        Parameters
+        ----------
+        track_id : str
+            The ID of the track.
+
+        Returns
+        -------
+        models.TrackWithSimpleArtist
+            The requested track.
+        """
+        return await self._tracks.submit(track_id)
+
+    async def get_show(self, show_id: str) -> models.SimpleShow:
+        """Get Spotify catalog information for a show.
+
+        Parameters
+        ----------
+        show_id : str
+            The ID of the show.
+
+        Returns
+        -------
+        models.SimpleShow
+            The requested show.
+        """
+        return await self._shows.submit(show_id)
+
+
+# MIT License
+#
+# Copyright (c) 2022-present novanai
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -10,70 +10,70 @@ if typing.TYPE_CHECKING:
     from spotify import api
 
 
-class Albums(pydantic.BaseModel):
+class Albums(models.BaseModel):
     albums: list[models.Album]
 
 
-class SimpleAlbumPaginator(pydantic.BaseModel):
+class SimpleAlbumPaginator(models.BaseModel):
     paginator: models.Paginator[models.SimpleAlbum] = pydantic.Field(alias="albums")
 
 
-class Artists(pydantic.BaseModel):
+class Artists(models.BaseModel):
     artists: list[models.Artist]
 
 
-class Tracks(pydantic.BaseModel):
+class Tracks(models.BaseModel):
     tracks: list[models.TrackWithSimpleArtist]
 
 
-class Audiobooks(pydantic.BaseModel):
+class Audiobooks(models.BaseModel):
     audiobooks: list[models.Audiobook]
 
 
-class CategoryPaginator(pydantic.BaseModel):
+class CategoryPaginator(models.BaseModel):
     paginator: models.Paginator[models.Category] = pydantic.Field(alias="categories")
 
 
-class Chapters(pydantic.BaseModel):
+class Chapters(models.BaseModel):
     chapters: list[models.Chapter]
 
 
-class Episodes(pydantic.BaseModel):
+class Episodes(models.BaseModel):
     episodes: list[models.Episode]
 
 
-class AvailableGenreSeeds(pydantic.BaseModel):
+class AvailableGenreSeeds(models.BaseModel):
     genres: list[str]
 
 
-class AvailableMarkets(pydantic.BaseModel):
+class AvailableMarkets(models.BaseModel):
     markets: list[str]
 
 
-class SnapshotID(pydantic.BaseModel):
+class SnapshotID(models.BaseModel):
     snapshot_id: str
 
 
-class Shows(pydantic.BaseModel):
+class Shows(models.BaseModel):
     shows: list[models.SimpleShow]
 
 
-class AudioFeatures(pydantic.BaseModel):
+class AudioFeatures(models.BaseModel):
     audio_features: list[models.AudioFeatures]
 
 
-class ArtistsPaginator(pydantic.BaseModel):
+class ArtistsPaginator(models.BaseModel):
     paginator: models.CursorPaginator[models.Artist] = pydantic.Field(alias="artists")
 
     @classmethod
-    def from_payload(cls, data: bytes, api_class: api.API) -> typing.Self:
-        obj = cls.model_validate_json(data)
+    async def from_payload(cls, data: bytes, api_class: api.API) -> typing.Self:
+        obj = await api_class._parse(cls, data)  # pyright: ignore[reportPrivateUsage]
         obj.paginator._api = api_class  # pyright: ignore[reportPrivateUsage]
         obj.paginator._item_type = models.Artist  # pyright: ignore[reportPrivateUsage]
         return obj
 
 
-class Devices(pydantic.BaseModel):
+class Devices(models.BaseModel):
     devices: list[models.Device]
 
 
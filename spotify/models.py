@@ -83,6 +83,9 @@ T = typing.TypeVar("T")
 
 
 class BaseModel(pydantic.BaseModel):
+    # core schemas are built on first use rather than at import time
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     # Occasionally, the value for this field is upper case and must be converted to lower case
     @pydantic.field_validator("album_type", mode="before", check_fields=False)
     @classmethod
@@ -1167,8 +1170,10 @@ class BasePaginator(
     """The requested content."""
 
     @classmethod
-    def from_payload(cls, data: bytes, api_class: api.API, item_type: type[T]) -> typing.Self:
-        obj = cls.model_validate_json(data)
+    async def from_payload(
+        cls, data: bytes, api_class: api.API, item_type: type[T]
+    ) -> typing.Self:
+        obj = await api_class._parse(cls, data)  # pyright: ignore[reportPrivateUsage]
         obj._api = api_class
         obj._item_type = item_type
         return obj
@@ -1194,9 +1199,8 @@ class BasePaginator(
         paginator = self
 
         while paginator.next is not None:
-            data = await self._api.get(paginator.next)
-            assert data is not None
-            paginator = type(self).from_payload(data, self._api, self._item_type)
+            data = await self._api.request("GET", paginator.next)
+            paginator = await type(self).from_payload(data, self._api, self._item_type)
 
             for item in paginator.items:
                 yield item
@@ -1205,9 +1209,8 @@ class BasePaginator(
         if self.next is None:
             return None
 
-        data = await self._api.get(self.next)
-        assert data is not None
-        return type(self).from_payload(data, self._api, self._item_type)
+        data = await self._api.request("GET", self.next)
+        return await type(self).from_payload(data, self._api, self._item_type)
 
 
 class Paginator(BasePaginator[T]):
@@ -1243,9 +1246,8 @@ class Paginator(BasePaginator[T]):
         if self.previous is None:
             return None
 
-        data = await self._api.get(self.previous)
-        assert data is not None
-        return type(self).from_payload(data, self._api, self._item_type)
+        data = await self._api.request("GET", self.previous)
+        return await type(self).from_payload(data, self._api, self._item_type)
 
 
 class CursorPaginator(BasePaginator[T]):
@@ -110,6 +110,10 @@ class AuthorizationCodeFlow:
             datetime.datetime.now(datetime.timezone.utc) + expires_in
         )
 
+        # Set by `API` to the connector of its session, so that token refreshes reuse its
+        # connection pool. The connector is owned and closed by the `API` session.
+        self.connector: aiohttp.BaseConnector | None = None
+
     @typing.overload
     @staticmethod
     def build_url(
@@ -307,6 +311,7 @@ class AuthorizationCodeFlow:
             "https://accounts.spotify.com/api/token",
             headers=headers,
             data=data,
+            connector=self.connector,
         ) as r:
             if not r.ok:
                 raise errors.APIError(r.status, r.reason)
@@ -365,6 +370,10 @@ class ClientCredentialsFlow:
             datetime.datetime.now(datetime.timezone.utc) + expires_in
         )
 
+        # Set by `API` to the connector of its session, so that token refreshes reuse its
+        # connection pool. The connector is owned and closed by the `API` session.
+        self.connector: aiohttp.BaseConnector | None = None
+
     @classmethod
     async def build_from_access_token(cls, client_id: str, client_secret: str) -> typing.Self:
         """Request an access token using the code returned by Spotify
@@ -391,7 +400,9 @@ class ClientCredentialsFlow:
             await self.refresh_access_token()
 
     async def refresh_access_token(self):
-        data = await self.request_access_token(self.client_id, self.client_secret)
+        data = await self.request_access_token(
+            self.client_id, self.client_secret, connector=self.connector
+        )
 
         self.access_token = data["access_token"]
         self.token_type = data["token_type"]
@@ -400,7 +411,11 @@ class ClientCredentialsFlow:
 
     @classmethod
     async def request_access_token(
-        cls, client_id: str, client_secret: str
+        cls,
+        client_id: str,
+        client_secret: str,
+        *,
+        connector: aiohttp.BaseConnector | None = None,
     ) -> dict[str, typing.Any]:
         async with aiohttp.request(
             "POST",
@@ -412,6 +427,7 @@ class ClientCredentialsFlow:
             data={
                 "grant_type": "client_credentials",
             },
+            connector=connector,
         ) as r:
             if not r.ok:
                 raise errors.APIError(r.status, r.reason)
@@ -1,18 +1,35 @@
+import asyncio
 import datetime
-import enum
+import functools
+import time
 import typing as t
+from enum import Enum
+from types import UnionType
 
-from spotify import types
+import pydantic
+
+from spotify import enums
+from spotify.types import MISSING
+
+ModelT = t.TypeVar("ModelT", bound=pydantic.BaseModel)
+
+LARGE_PAYLOAD_SIZE = 16384
+"""Payloads larger than this many bytes are validated in a worker thread."""
+
+# every enum in `spotify.enums`, so values can be unwrapped with a set lookup instead of isinstance
+_ENUM_TYPES = frozenset(
+    v for v in vars(enums).values() if isinstance(v, type) and issubclass(v, Enum)
+)
 
 
 def process_dict(dict_: dict[str, t.Any]) -> dict[str, t.Any]:
     return {
-        k: v.value if isinstance(v, enum.Enum) else v
-        for k, v in dict_.items()
-        if v is not types.MISSING
+        k: v._value_ if type(v) in _ENUM_TYPES else v for k, v in dict_.items() if v is not MISSING
     }
 
 
+# release dates repeat heavily within a page (e.g. every track of an album shares one)
+@functools.lru_cache(maxsize=4096)
 def datetime_from_timestamp(time: str) -> datetime.datetime:
     date = time.split("-")
     if len(date) == 1:
@@ -23,6 +40,127 @@ def datetime_from_timestamp(time: str) -> datetime.datetime:
         return datetime.datetime(int(date[0]), int(date[1]), int(date[2]))
 
 
+async def validate_json(model: type[ModelT], data: bytes) -> ModelT:
+    # Validating large payloads (e.g. a page of 50 full tracks) can take long enough to stall
+    # every other task on the event loop, so hand them to a worker thread instead.
+    if len(data) > LARGE_PAYLOAD_SIZE:
+        return await asyncio.to_thread(model.model_validate_json, data)
+
+    return model.model_validate_json(data)
+
+
+def construct_model(model: type[ModelT], data: dict[str, t.Any]) -> ModelT:
+    """Build `model` from decoded JSON without validating it, recursing into nested models.
+
+    Field validators are not run, so values are left exactly as Spotify sent them.
+    """
+    values: dict[str, t.Any] = {}
+    for name, key, annotation, _ in _model_fields(model):
+        if key in data:
+            values[name] = _construct_value(annotation, data[key])
+
+    return model.model_construct(**values)
+
+
+@functools.cache
+def _model_fields(model: type[pydantic.BaseModel]) -> tuple[tuple[str, str, t.Any, bool], ...]:
+    # (name, JSON key, annotation, required) for each field of the model. Pydantic leaves the
+    # annotations of fields referring to models defined later in a module as forward references.
+    hints: dict[str, t.Any] = {}
+    fields: list[tuple[str, str, t.Any, bool]] = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if isinstance(annotation, t.ForwardRef):
+            hints = hints or t.get_type_hints(model)
+            annotation = hints[name]
+
+        fields.append((name, field.alias or name, annotation, field.is_required()))
+
+    return tuple(fields)
+
+
+def _construct_value(annotation: t.Any, value: t.Any) -> t.Any:
+    if value is None:
+        return None
+
+    origin = t.get_origin(annotation)
+    if origin is list and isinstance(value, list):
+        (item_type,) = t.get_args(annotation)
+        return [_construct_value(item_type, item) for item in t.cast(list[t.Any], value)]
+    elif (origin is t.Union or origin is UnionType) and isinstance(value, dict):
+        # Use the first model in the union whose required fields are all present
+        for arg in t.get_args(annotation):
+            if _is_model(arg) and all(
+                key in value for _, key, _, required in _model_fields(arg) if required
+            ):
+                return _construct_value(arg, value)
+    elif _is_model(annotation) and isinstance(value, dict):
+        return construct_model(annotation, t.cast(dict[str, t.Any], value))
+
+    return value
+
+
+def _is_model(annotation: t.Any) -> t.TypeGuard[type[pydantic.BaseModel]]:
+    return isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel)
+
+
+_NOT_BOOL_BYTES = bytes(b for b in range(256) if b not in b"tf")
+
+
+def parse_bool_list(data: bytes) -> list[bool]:
+    # The payload is a flat JSON array of booleans, so every `t` starts a `true` and every
+    # `f` starts a `false`. Deleting all other bytes leaves one byte per item.
+    return [b == 0x74 for b in data.translate(None, _NOT_BOOL_BYTES)]
+
+
+class RateLimiter:
+    """A token bucket allowing `rate` requests every `per` seconds, in bursts of up to `rate`.
+
+    Rates below one request every `per` seconds still allow a burst of one request.
+    Waiters are served in the order they called `acquire`.
+    """
+
+    __slots__ = ("rate", "per", "_capacity", "_tokens", "_updated", "_paused_until", "_lock")
+
+    def __init__(self, rate: float, per: float = 1.0) -> None:
+        if rate <= 0 or per <= 0:
+            raise ValueError("`rate` and `per` must be greater than 0")
+
+        self.rate = rate
+        self.per = per
+
+        # a bucket smaller than one token could never be drawn from
+        self._capacity = max(rate, 1)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be made."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self.rate / self.per
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for `seconds`, e.g. after being rate limited."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
 # MIT License
 #
 # Copyright (c) 2022-present novanai